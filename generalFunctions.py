@@ -4,15 +4,199 @@ Documentation for scraper methods on github [https://github.com/DI0Rdano/NHL-API
 Follow @DI0Rdano on Twitter/X [https://x.com/DI0Rdano].
 """
 
+import os
+import re
 import json
-import time
+import sqlite3
 import requests
-from datetime import datetime
+from calendar import monthrange
+from threading import Lock
+from collections import OrderedDict, deque
+from copy import deepcopy
+from functools import lru_cache, wraps
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode, quote
 from typing import Union, Any
 
-def make_api_request(url: str, timeout: int = 10, retries: int = 3, backoff: float = 0.1, validation: bool = False, return_json: bool = True) -> dict:
+try:
+    from orjson import loads as _json_loads # Optional, faster C decoder for large responses
+except ImportError:
+    from json import loads as _json_loads
+
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_MAX_BACKOFF = 30.0 # Upper bound on the delay between retry attempts in seconds
+_RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+_SORT_DIRECTIONS = frozenset(("ASC", "DESC"))
+_URL_SAFE_CHARS = ",:[]{}\"" # Left unescaped in query values, matching what the API expects in sort and include parameters
+_POOL_CONNECTIONS = 16 # Number of hosts to keep connection pools for
+_POOL_MAXSIZE = 32 # Number of keep-alive connections kept per host
+_RESPONSE_CACHE_MAXSIZE = 256 # Number of response bodies kept for conditional requests
+_RESPONSE_CACHE = OrderedDict() # url -> (conditional request headers, response body)
+_RESPONSE_CACHE_LOCK = Lock()
+
+@lru_cache(maxsize=None)
+def _get_session(retries: int, backoff: float) -> requests.Session:
+    """
+    Get a shared session with a retrying adapter mounted, one per distinct retry configuration.
+
+    Parameters:
+    - `retries` (int): The total number of attempts, including the first request.
+    - `backoff` (float): The base delay between retry attempts in seconds.
+
+    Returns:
+    - `requests.Session`: Session that retries connection errors and transient status codes, honoring 'Retry-After'.
+    """
+    retry_kwargs = {"total": max(retries - 1, 0), "backoff_factor": backoff, "status_forcelist": _RETRY_STATUSES, "allowed_methods": frozenset({"GET"}), "respect_retry_after_header": True, "raise_on_status": False}
+    try:
+        retry = Retry(**retry_kwargs, backoff_max=_MAX_BACKOFF, backoff_jitter=backoff / 4)
+    except TypeError: # urllib3 < 2 has no backoff_max or backoff_jitter arguments, retry without jitter and with its default cap on the delay
+        retry = Retry(**retry_kwargs)
+    adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _get_cached_response(url: str) -> tuple:
+    """Get the conditional request headers and body cached for a URL, or None if it has not been cached."""
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(url)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(url)
+        return cached
+
+def _cache_response(url: str, response: requests.Response, force: bool = False) -> None:
+    """Cache the body of a response along with the headers to revalidate it, if the server provided an ETag or Last-Modified, caching is forced, or the URL is already cached and must not keep an older body."""
+    headers = {}
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+
+    with _RESPONSE_CACHE_LOCK:
+        if not headers and not force and url not in _RESPONSE_CACHE:
+            return
+        _RESPONSE_CACHE[url] = (headers, response.content)
+        _RESPONSE_CACHE.move_to_end(url)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+def clear_response_cache() -> None:
+    """Clear the response bodies cached for conditional requests."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+def save_response_cache(path: str) -> int:
+    """
+    Save the response bodies cached for conditional requests to a SQLite file, so they can be revalidated in a later session.
+
+    Parameters:
+    - `path` (str): The path of the SQLite file, created if it does not exist.
+
+    Returns:
+    - `int`: The number of responses saved.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        rows = [(url, json.dumps(headers), body) for url, (headers, body) in _RESPONSE_CACHE.items()]
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, headers TEXT NOT NULL, body BLOB NOT NULL)")
+        connection.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", rows)
+    connection.close()
+
+    return len(rows)
+
+def load_response_cache(path: str) -> int:
+    """
+    Load response bodies saved with save_response_cache into the cache for conditional requests. Unchanged resources are then answered with '304 Not Modified' instead of being downloaded again.
+
+    Parameters:
+    - `path` (str): The path of the SQLite file.
+
+    Returns:
+    - `int`: The number of responses loaded, at most the size of the cache, or 0 if the file does not exist or has no saved responses.
+    """
+    if not os.path.isfile(path): # sqlite3.connect would create an empty file
+        return 0
+
+    with sqlite3.connect(path) as connection:
+        try:
+            # save_response_cache writes from least to most recently used and a replaced row gets a new rowid, so rowid follows recency
+            rows = connection.execute("SELECT url, headers, body FROM responses ORDER BY rowid DESC LIMIT ?", (_RESPONSE_CACHE_MAXSIZE,)).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+    connection.close()
+
+    with _RESPONSE_CACHE_LOCK:
+        for url, headers, body in reversed(rows): # Oldest first, so the most recent responses end up last in the LRU order
+            _RESPONSE_CACHE[url] = (json.loads(headers), body)
+            _RESPONSE_CACHE.move_to_end(url)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+    return len(rows)
+
+def _hashable(value: Any) -> Any:
+    """Convert lists and dicts in a value into tuples so it can be used as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_hashable(val) for val in value)
+    return value
+
+def memoize_response(func):
+    """
+    Memoize a function returning static API data, keyed on its arguments.
+    Results of 'None' are not cached, and a deep copy is returned on a hit so callers cannot modify the cached result.
+    The cache is cleared with the `cache_clear()` attribute of the decorated function.
+    """
+    cache = {}
+    lock = Lock()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (_hashable(args), _hashable(kwargs))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        with lock:
+            if key in cache:
+                return deepcopy(cache[key])
+
+        result = func(*args, **kwargs)
+        if result is not None:
+            with lock:
+                cache[key] = deepcopy(result)
+        return result
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+def _validate_request_args(url: str, timeout: int, retries: int) -> None:
+    """Raise a ValueError if the arguments to make_api_request are not of the expected types."""
+    if type(url) is not str:
+        raise ValueError(f"Invalid url='{url}', parameter must be a string.")
+
+    if type(timeout) is not int or not timeout > 0:
+        raise ValueError(f"Invalid timeout='{timeout}', parameter must be a positive integer.")
+
+    if type(retries) is not int or not retries > 0:
+        raise ValueError(f"Invalid retries='{retries}', parameter must be a positive integer.")
+
+def make_api_request(url: str, timeout: int = 10, retries: int = 3, backoff: float = 0.1, validation: bool = False, return_json: bool = True, session: requests.Session = None, cache: bool = False) -> dict:
     """
     Make a request to the API and handle retries and error conditions.
+    Responses with an ETag or Last-Modified header are cached and revalidated on the next request, reusing the cached body when the server replies '304 Not Modified'.
+    With `cache` enabled, a cached response is reused without contacting the server at all, for resources that no longer change such as finished games.
 
     Parameters:
     - `url` (str): The URL to make the API request to.
@@ -20,46 +204,93 @@ def make_api_request(url: str, timeout: int = 10, retries: int = 3, backoff: flo
     Additional Parameters:
     - `timeout` (int): The timeout duration for the request in seconds. Default is '10'.
     - `retries` (int): The number of retry attempts in case of failure. Default is '3'.
-    - `backoff` (float): The delay before the next retry attempt in seconds. Default is '0.1'.
+    - `backoff` (float): The base delay before the next retry attempt in seconds, doubled per attempt with jitter and capped at 30 seconds. Default is '0.1'.
     - `validation` (bool): Flag to enable/disable input validation. Default is 'False'.
     - `return_json` (bool): Flag to determine whether to return JSON or raw text. Default is 'True'.
+    - `session` (requests.Session | None): The session to send the request with. Default is 'None' which uses a shared keep-alive session configured with the provided retries and backoff.
+    - `cache` (bool): Flag to reuse a cached response without revalidating it, and to cache the response even if it cannot be revalidated. Default is 'False'.
 
     Returns:
     - `json` (dict | None): The JSON response from the API or none in case of error.
     """
-    session = requests.Session()
-
     if validation:
-        if not isinstance(url, str):
-            raise ValueError(f"Invalid url='{url}', parameter must be a string.")
+        _validate_request_args(url, timeout, retries)
 
-        if not isinstance(timeout, int) or not timeout > 0:
-            raise ValueError(f"Invalid timeout='{timeout}', parameter must be a positive integer.")
+    try:
+        cached = _get_cached_response(url)
+        if cache and cached is not None:
+            content, encoding = cached[1], None
+        else:
+            session = session if session is not None else _get_session(retries, backoff)
+            response = session.get(url, timeout=timeout, headers=cached[0] if cached else None)
+
+            if response.status_code == 304 and cached:
+                content = cached[1]
+            else:
+                response.raise_for_status()
+                content = response.content
+                _cache_response(url, response, force=cache)
+            encoding = response.encoding
 
-        if not isinstance(retries, int) or not retries > 0:
-            raise ValueError(f"Invalid retries='{retries}', parameter must be a positive integer.")
+        if not content:
+            return None
 
-    for attempt in range(retries):
-        try:
-            response = session.get(url, timeout=timeout)
-            response.raise_for_status()
-            
-            if not response.content:
-                return None
-                
-            if return_json:
-                return response.json()
-            else:
-                return response.text
-        
-        except requests.exceptions.RequestException as e:
-            if attempt < retries - 1:
-                delay = (2 ** attempt) * backoff 
-                time.sleep(delay) 
-            else:
-                return None
-            
-    return None
+        if return_json:
+            return _json_loads(content)
+        else:
+            return content.decode(encoding or "utf-8", errors="replace")
+
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+def make_api_requests(urls: list, timeout: int = 10, retries: int = 3, backoff: float = 0.1, validation: bool = False, return_json: bool = True, max_workers: int = 8, session: requests.Session = None, cache: bool = False) -> list:
+    """
+    Make several independent requests to the API concurrently.
+
+    Parameters:
+    - `urls` (list[str]): The URLs to make the API requests to.
+
+    Additional Parameters:
+    - `timeout` (int): The timeout duration for each request in seconds. Default is '10'.
+    - `retries` (int): The number of retry attempts in case of failure. Default is '3'.
+    - `backoff` (float): The base delay before the next retry attempt in seconds. Default is '0.1'.
+    - `validation` (bool): Flag to enable/disable input validation. Default is 'False'.
+    - `return_json` (bool): Flag to determine whether to return JSON or raw text. Default is 'True'.
+    - `max_workers` (int): The max number of requests in flight at once. Default is '8'.
+    - `session` (requests.Session | None): The session to send the requests with. Default is 'None' which uses the shared keep-alive session.
+    - `cache` (bool): Flag to reuse cached responses without revalidating them, see make_api_request. Default is 'False'.
+
+    Returns:
+    - `list` (list[dict | None]): The responses in the same order as the URLs, with None for failed requests.
+    """
+    if len(urls) <= 1:
+        return [make_api_request(url, timeout, retries, backoff, validation, return_json, session, cache) for url in urls]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: make_api_request(url, timeout, retries, backoff, validation, return_json, session, cache), urls))
+
+def iter_api_requests(urls: list, timeout: int = 10, retries: int = 3, backoff: float = 0.1, validation: bool = False, return_json: bool = True, max_workers: int = 8, session: requests.Session = None, cache: bool = False):
+    """
+    Make several independent requests to the API concurrently, yielding the responses in the same order as the URLs as they arrive.
+    At most `max_workers` responses are held at once, so the caller can process each one before the rest are downloaded.
+
+    Parameters:
+    - `urls` (list[str]): The URLs to make the API requests to.
+
+    Additional Parameters:
+    - Same as make_api_requests.
+
+    Yields:
+    - `json` (dict | None): The response for each URL, or None for a failed request.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for url in urls:
+            pending.append(executor.submit(make_api_request, url, timeout, retries, backoff, validation, return_json, session, cache))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 def filter_view(data: dict, view: str, validation: bool = False) -> dict:
     """
@@ -79,14 +310,30 @@ def filter_view(data: dict, view: str, validation: bool = False) -> dict:
     if not view:
         return data
 
+    if not validation:
+        try:
+            return _compile_view(view)(data)
+        except (KeyError, TypeError):
+            return None
+
     for field in view.split("."): # Split the view string by "." to handle nested fields
-        if validation and field not in data: 
+        if field not in data:
             raise ValueError(f"Invalid view='{view}'. Field '{field}' not found. Valid fields at this level include: {', '.join(data.keys())}.")
-        elif not validation and field not in data:
-            return None
         data = data[field]
     return data
 
+@lru_cache(maxsize=256)
+def _compile_view(view: str):
+    """Build an accessor for a dot-delimited view, cached since callers tend to repeat the same views."""
+    getters = [itemgetter(field) for field in view.split(".")]
+
+    def get_view(data: dict) -> Any:
+        for get_field in getters:
+            data = get_field(data)
+        return data
+
+    return get_view
+
 def get_nested_value(data: dict, key: str) -> Any:
     """
     Get a value from a nested dictionary using a dot-delimited key.
@@ -96,14 +343,42 @@ def get_nested_value(data: dict, key: str) -> Any:
     - `key` (str): The dot-delimited key string.
 
     Returns:
-    - The value if found, else None.
+    - The value if found, else None. Falsy values such as '0' or 'False' are returned as is.
     """
-    keys = key.split(".")
-    for k in keys:
-        data = data.get(k, {})
-    return data if data else None
+    for k in key.split("."):
+        data = data.get(k) if isinstance(data, dict) else None
+        if data is None:
+            return None
+    return data
 
-def filter_json_data(data: dict, filters: dict, exclude: bool = False) -> dict:
+def _compile_filter(key: str, value: Any):
+    """Build the predicate for a single filter, looking up the nested value once per item and matching list values with a set when possible."""
+    if "." in key:
+        get_value = lambda item: get_nested_value(item, key)
+    else: # Top level field, a plain lookup avoids splitting the key for every item
+        get_value = lambda item: item.get(key)
+
+    if value is None:
+        return lambda item: get_value(item) is None
+
+    if not isinstance(value, list):
+        return lambda item: get_value(item) == value
+
+    try:
+        values = frozenset(value)
+    except TypeError: # Unhashable values in the list, fall back to the list itself
+        values = value
+
+    def matches(item: dict) -> bool:
+        found = get_value(item)
+        try:
+            return found in values or found == value
+        except TypeError: # Unhashable found value tested against the set
+            return found in value or found == value
+
+    return matches
+
+def filter_json_data(data: dict, filters: dict, exclude: bool = False, exclude_filters: dict = None) -> dict:
     """
     Filter data based on the provided filters.
 
@@ -113,57 +388,204 @@ def filter_json_data(data: dict, filters: dict, exclude: bool = False) -> dict:
 
     Additional Parameters
     - `exclude` (bool): Flag to indicate whether to exclude data based on the filters. Default is `False`.
+    - `exclude_filters` (dict | None): Dictionary of filter parameters to exclude, applied in the same pass as `filters`. Default is `None` which excludes nothing.
 
     Returns:
     - `json` (dict): Filtered data based on the provided filters.
     """
     #TODO add validation and modify to work with multiple inclusions/exclusions {"param1": val1, "param2": val2}
 
-    if not filters:
+    if not filters and not exclude_filters:
         return data
 
+    predicates = [_compile_filter(key, value) for key, value in filters.items()] if filters else []
+    exclude_predicates = [_compile_filter(key, value) for key, value in exclude_filters.items()] if exclude_filters else []
+
     filtered_data = [
         item for item in data
-        if exclude ^ all(
-            (get_nested_value(item, key) == value if value is not None else get_nested_value(item, key) is None) or
-            (isinstance(value, list) and get_nested_value(item, key) in value)
-            for key, value in filters.items()
-        )
+        if (not predicates or exclude ^ all(matches(item) for matches in predicates))
+        and not (exclude_predicates and all(matches(item) for matches in exclude_predicates))
     ]
 
     return filtered_data
 
+def construct_url(base_url: str, sort_param: str = None, includes: list = None, filter_fields: Union[str, list] = None) -> str:
+    """
+    Construct an API URL from its base and query parameters.
+
+    Parameters:
+    - `base_url` (str): The base URL, including the trailing '?'.
+    - `sort_param` (str | None): Sorting parameters from construct_sorting_params. Default is 'None'.
+    - `includes` (list[str] | None): Fields to add as 'include=' parameters. Default is 'None'.
+    - `filter_fields` (str | list[str] | None): Additional fields to add as 'include=' parameters. Default is 'None'.
+
+    Returns:
+    - `str`: The URL with its query parameters joined by '&'.
+    """
+    fields = tuple(includes or ()) + ((filter_fields,) if isinstance(filter_fields, str) else tuple(filter_fields or ()))
+    query_params = [param for param in (sort_param, _construct_include_params(fields)) if param]
+
+    return base_url + "&".join(query_params)
+
+@lru_cache(maxsize=256)
+def _construct_include_params(fields: tuple) -> str:
+    """Construct the URL-encoded 'include=' parameters for a tuple of fields, cached since callers tend to repeat the same fields."""
+    return urlencode([("include", field) for field in fields], safe=_URL_SAFE_CHARS, quote_via=quote)
+
+def encode_query(params: dict) -> str:
+    """URL-encode query parameters, leaving the characters the API expects in sort and filter values unescaped."""
+    return urlencode(params, safe=_URL_SAFE_CHARS, quote_via=quote)
+
+def _validate_sorting_args(sort: Union[str, list], direction: Union[str, list]) -> None:
+    """Raise a ValueError if the sort fields or directions passed to construct_sorting_params are invalid."""
+    if type(sort) is not str and type(sort) is not list:
+        raise ValueError("Invalid input type for sort parameter. Must be a string or a list of strings.")
+    if type(direction) is not str and type(direction) is not list:
+        raise ValueError("Invalid input type for direction parameter. Must be a string or a list of strings.")
+
+    invalid_directions = set(direction if type(direction) is list else [direction]) - _SORT_DIRECTIONS
+    if invalid_directions:
+        raise ValueError(f"Invalid sort direction(s): {', '.join(sorted(map(str, invalid_directions)))}. Must be 'ASC' or 'DESC'.")
+    #TODO update sorting validation
+
+def to_list(value: Any) -> Any:
+    """Wrap a single string argument in a list, leaving lists and None unchanged."""
+    return [value] if isinstance(value, str) else value
+
+def normalize_sort_args(sort: Union[str, list], direction: Union[str, list, None], validation: bool = False) -> tuple:
+    """
+    Normalize the sort and direction arguments of a method into lists of the same length.
+
+    Parameters:
+    - `sort` (str | list[str]): Field(s) to sort by.
+    - `direction` (str | list[str] | None): Sort direction(s), a single direction applies to every field.
+    - `validation` (bool): Flag to enable/disable checking that a list of directions matches the sort fields. Default is 'False'.
+
+    Returns:
+    - `tuple`: The sort fields and directions as lists, unchanged if no sort fields are provided.
+    """
+    if sort is None:
+        return sort, direction
+
+    sort = to_list(sort)
+    direction = direction if isinstance(direction, list) else [direction] * len(sort)
+    if validation and len(direction) != len(sort):
+        raise ValueError(f"Invalid direction='{direction}'. Provide one direction per sort field ({len(sort)}).")
+    return sort, direction
+
+def _sort_by_field(data: list, field: str, reverse: bool) -> None:
+    """Stable sort of a list of JSON objects in place by a single field, with null or missing values after the others (before them when reversed)."""
+    values = [item for item in data if item.get(field) is not None]
+    if len(values) == len(data):
+        data.sort(key=itemgetter(field), reverse=reverse)
+        return
+
+    nulls = [item for item in data if item.get(field) is None]
+    values.sort(key=itemgetter(field), reverse=reverse)
+    data[:] = nulls + values if reverse else values + nulls
+
+def sort_json_data(data: list, sort: Union[str, list], direction: Union[str, list]) -> list:
+    """
+    Sort a list of JSON objects in place by one or more fields. Objects missing a field, or with a null value, sort after the others (before them when sorting 'DESC').
+
+    Parameters:
+    - `data` (list[dict]): The JSON objects to sort.
+    - `sort` (str | list[str]): Field(s) to sort by, in order of priority.
+    - `direction` (str | list[str] | None): Sort direction(s) ('ASC' or 'DESC'). A missing direction sorts 'ASC'.
+
+    Returns:
+    - `list`: The sorted data.
+    """
+    if len(data) < 2: # Nothing to reorder, common for empty responses
+        return data
+
+    sort, direction = normalize_sort_args(sort, direction)
+    sort_spec = [(field, (dir or "ASC").upper() == "DESC") for field, dir in zip(sort, direction)] # Fields without a direction sort 'ASC'
+    reverse_flags = {reverse for _, reverse in sort_spec}
+
+    if len(sort_spec) == 1:
+        _sort_by_field(data, *sort_spec[0])
+    elif len(reverse_flags) == 1: # Every field sorts in the same direction, so a single pass over a composite key is enough
+        fields = [s for s, _ in sort_spec]
+        data.sort(key=lambda x: tuple(((value := x.get(s)) is None, value) for s in fields), reverse=reverse_flags.pop())
+    else:
+        for s, reverse in reversed(sort_spec): # Stable sorts from the lowest to the highest priority field
+            _sort_by_field(data, s, reverse)
+
+    return data
+
+@lru_cache(maxsize=256)
+def _compile_fields(fields: tuple):
+    """Build the accessor returning a tuple of the values of `fields`, cached since callers project many lists onto the same fields."""
+    return itemgetter(*fields) if len(fields) > 1 else lambda item: (item[fields[0]],)
+
+def filter_json_fields(data: list, filter_fields: Union[str, list]) -> list:
+    """
+    Project each JSON object onto the provided fields, skipping fields an object does not have.
+
+    Parameters:
+    - `data` (list[dict]): The JSON objects to project.
+    - `filter_fields` (str | list[str]): The fields to keep, in the order they should appear.
+
+    Returns:
+    - `list`: New JSON objects containing only the provided fields.
+    """
+    fields = (filter_fields,) if isinstance(filter_fields, str) else tuple(filter_fields)
+    get_fields = _compile_fields(fields)
+
+    filtered_data = []
+    for item in data:
+        try:
+            filtered_data.append(dict(zip(fields, get_fields(item)))) # Fast path when the object has every field
+        except KeyError:
+            filtered_data.append({key: item[key] for key in fields if key in item})
+
+    return filtered_data
+
 def construct_sorting_params(sort: Union[str, list], direction: Union[str, list], validation: bool = False) -> str:
     """
     Construct sorting parameters for the API URL.
 
     Parameters:
     - `sort` (str | list): Field(s) to sort by.
-    - `direction` (str | list): Sort direction(s) ('ASC' or 'DESC').
-    - `validation` (bool): Flag to enable/disable input validation for sort and direction. Default is True.
+    - `direction` (str | list): Sort direction(s) ('ASC' or 'DESC'), a single direction applies to every field.
+    - `validation` (bool): Flag to enable/disable input validation for sort and direction. Default is False.
 
     Returns:
     - `str`: Sorting parameters as an f-string.
     """
     if validation:
-        if not isinstance(sort, (str, list)):
-            raise ValueError("Invalid input type for sort parameter. Must be a string or a list of strings.")
-        if not isinstance(direction, (str, list)):
-            raise ValueError("Invalid input type for direction parameter. Must be a string or a list of strings.")
-
-    sort = sort if isinstance(sort, list) else [sort]
-    direction = direction if isinstance(direction, list) else [direction]
-
-    valid_directions = {'ASC', 'DESC'}
-    for dir in direction:
-        if validation and dir not in valid_directions:
-            raise ValueError(f"Invalid sort direction: {dir}. Must be 'ASC' or 'DESC'.")
-    #TODO update sorting validation
-
-    sort_params = [{"property": field, "direction": dir} for field, dir in zip(sort, direction)]
-    sort_json = json.dumps(sort_params)
-
-    return f"sort={sort_json}"
+        _validate_sorting_args(sort, direction)
+
+    sort, direction = normalize_sort_args(sort, direction) # A single direction applies to every field
+
+    sort_params = ",".join(f'{{"property":{json.dumps(field)},"direction":{json.dumps(dir)}}}' for field, dir in zip(sort, direction)) # Escapes the fields, a missing direction is sent as null
+
+    return f"sort=[{sort_params}]"
+
+def _format_position(value: Union[str, list]) -> str:
+    """Format a single position code or a list of position codes for the cayenneExp."""
+    if isinstance(value, list):
+        return "(" + " or ".join(f"positionCode='{pos}'" for pos in value) + ")"
+    return f"positionCode='{value}'"
+
+_CAYENNE_EXP_FORMATTERS = {
+    "game_type": lambda value: f"gameTypeId={value}",
+    "franchise_id": lambda value: f"franchiseId={int(value)}",
+    "opponent_franchise_id": lambda value: f"opponentFranchiseId={int(value)}",
+    "home_or_road": lambda value: f"homeRoad='{value}'",
+    "game_result": lambda value: f"decision='{value}'",
+    "position": _format_position,
+    "player_name": lambda value: f"skaterFullName likeIgnoreCase '%{value}%'",
+    "is_rookie": lambda value: f"isRookie={'1' if value else '0'}",
+    "is_active": lambda value: f"active={'1' if value else '0'}",
+    "is_in_hall_of_fame": lambda value: f"isInHallOfFame={'1' if value else '0'}",
+    "birth_state_province_code": lambda value: f"birthStateProvinceCode='{value}'",
+    "nationality_code": lambda value: f"nationalityCode='{value}'",
+    "shoots_catches": lambda value: f"shootsCatches='{value}'",
+    "draft_round": lambda value: f"draftRound={value}",
+    "draft_year": lambda value: f"draftYear='{value}'",
+}
 
 def construct_cayenne_exp(start_season: str = None, end_season: str = None, start_date: str = None, end_date: str = None, season: str = None, default_kwargs: dict = None) -> str:
     """
@@ -192,42 +614,7 @@ def construct_cayenne_exp(start_season: str = None, end_season: str = None, star
         cayenne_exp_parts.append(f"seasonId={season}")
 
     if default_kwargs:
-        for key, value in default_kwargs.items():
-            if value is not None:
-                if key == "game_type":
-                    cayenne_exp_parts.append(f"gameTypeId={value}")
-                elif key == "franchise_id":
-                    cayenne_exp_parts.append(f"franchiseId={int(value)}")
-                elif key == "opponent_franchise_id":
-                    cayenne_exp_parts.append(f"opponentFranchiseId={int(value)}")
-                elif key == "home_or_road":
-                    cayenne_exp_parts.append(f"homeRoad='{value}'")
-                elif key == "game_result":
-                    cayenne_exp_parts.append(f"decision='{value}'")
-                elif key == "position":
-                    if isinstance(value, str):
-                        cayenne_exp_parts.append(f"positionCode='{value}'")
-                    elif isinstance(value, list):
-                        position_exp = " or ".join([f"positionCode='{pos}'" for pos in value])
-                        cayenne_exp_parts.append(f"({position_exp})")
-                elif key == "player_name":
-                    cayenne_exp_parts.append(f"skaterFullName likeIgnoreCase '%{value}%'")
-                elif key == "is_rookie":
-                    cayenne_exp_parts.append(f"isRookie={'1' if value else '0'}")
-                elif key == "is_active":
-                    cayenne_exp_parts.append(f"active={'1' if value else '0'}")
-                elif key == "is_in_hall_of_fame":
-                    cayenne_exp_parts.append(f"isInHallOfFame={'1' if value else '0'}")
-                elif key == "birth_state_province_code":
-                    cayenne_exp_parts.append(f"birthStateProvinceCode='{value}'")
-                elif key == "nationality_code":
-                    cayenne_exp_parts.append(f"nationalityCode='{value}'")
-                elif key == "shoots_catches":
-                    cayenne_exp_parts.append(f"shootsCatches='{value}'")
-                elif key == "draft_round":
-                    cayenne_exp_parts.append(f"draftRound={value}")
-                elif key == "draft_year":
-                    cayenne_exp_parts.append(f"draftYear='{value}'")
+        cayenne_exp_parts.extend(formatter(value) for key, value in default_kwargs.items() if value is not None and (formatter := _CAYENNE_EXP_FORMATTERS.get(key)))
 
     return " and ".join(cayenne_exp_parts)
 
@@ -243,10 +630,10 @@ def construct_fact_cayenne_exp(min_gp: int, max_gp: int, default_kwargs: dict) -
     Returns:
     - `str`: The constructed factCayenneExp.
     """
-    fact_cayenne_exp = f"gamesPlayed>={min_gp}"
+    fact_cayenne_exp_parts = [f"gamesPlayed>={min_gp}"]
 
     if max_gp is not None:
-        fact_cayenne_exp += f" and gamesPlayed<={max_gp}"
+        fact_cayenne_exp_parts.append(f"gamesPlayed<={max_gp}")
 
     if default_kwargs.get("property") is not None:
         property = default_kwargs.get("property")
@@ -257,10 +644,55 @@ def construct_fact_cayenne_exp(min_gp: int, max_gp: int, default_kwargs: dict) -
         comparator = comparator if isinstance(comparator, list) else [comparator]
         value = value if isinstance(value, list) else [value]
 
-        for prop, comp, val in zip(property, comparator, value):
-            fact_cayenne_exp += f" and {prop}{comp}{val}"
+        fact_cayenne_exp_parts.extend(f"{prop}{comp}{val}" for prop, comp, val in zip(property, comparator, value))
+
+    return " and ".join(fact_cayenne_exp_parts)
+
+def _format_cayenne_value(value: Any) -> Union[str, None]:
+    """Format a filter value as a cayenneExp literal, or None if it cannot be expressed safely."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str) and "'" not in value:
+        return f"'{value}'"
+    return None
+
+def construct_filter_cayenne_exp(filters: dict, fields: frozenset, exclude: bool = False) -> tuple:
+    """
+    Translate filters on top-level fields into a cayenneExp expression, so the API applies them instead of the client.
+
+    Parameters:
+    - `filters` (dict | None): Dictionary containing filter parameters and their corresponding values, as passed to filter_json_data.
+    - `fields` (frozenset): The fields the endpoint can filter on.
+    - `exclude` (bool): Flag to indicate whether the filters exclude data. Exclusions are only pushed down when every filter can be. Default is 'False'.
+
+    Returns:
+    - `tuple`: The cayenneExp expression or None, and a dictionary of the filters left to apply with filter_json_data or None.
+    """
+    if not filters:
+        return None, filters
 
-    return fact_cayenne_exp
+    clauses, remaining = [], {}
+    for key, value in filters.items():
+        values = value if isinstance(value, list) else [value]
+        literals = [_format_cayenne_value(val) for val in values]
+        if key not in fields or not literals or None in literals:
+            remaining[key] = value
+            continue
+
+        if exclude: # filter_json_data keeps objects with a null or missing value, which '!=' alone would drop on the server
+            not_equal = " and ".join(f"{key}!={literal}" for literal in literals)
+            clauses.append(f"{key}=null or {not_equal}" if len(literals) == 1 else f"{key}=null or ({not_equal})")
+        else:
+            clauses.append(f"{key}={literals[0]}" if len(literals) == 1 else f"({' or '.join(f'{key}={literal}' for literal in literals)})")
+
+    if exclude:
+        if remaining: # Excluding requires every filter to match, keep them together on the client
+            return None, filters
+        return f"({' or '.join(f'({clause})' for clause in clauses)})" if len(clauses) > 1 else f"({clauses[0]})", None
+
+    return (" and ".join(clauses) or None), (remaining or None)
 
 def convert_time_to_seconds(time_str: str) -> int:
     """Convert a time string in the format MM:SS to an integer count of seconds."""
@@ -268,17 +700,33 @@ def convert_time_to_seconds(time_str: str) -> int:
     return minutes * 60 + seconds
 
 def format_date(date_string: str) -> str:
-    try:
-        parsed_date = datetime.strptime(date_string, "%Y-%m-%d")
-        formatted_date = parsed_date.strftime("%Y-%m-%d") # Format the date as "YYYY-MM-DD"
-        return formatted_date
-    except ValueError:
+    match = _DATE_RE.match(date_string) if isinstance(date_string, str) else None
+    if not match:
+        raise ValueError("Error: Invalid date format")
+    year, month, day = map(int, match.groups())
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]): # Reject impossible days such as '2023-02-29'
         raise ValueError("Error: Invalid date format")
+    return date_string # Already formatted as "YYYY-MM-DD"
 
 def format_month(date_string: str) -> str:
-    try:
-        parsed_date = datetime.strptime(date_string, "%Y-%m-%d")
-        formatted_date = parsed_date.strftime("%Y-%m") # Format the date as "YYYY-MM"
-        return formatted_date
-    except ValueError:
-        raise ValueError("Error: Invalid date format")
+    return format_date(date_string)[:7] # Format the date as "YYYY-MM"
+
+def normalize_seasons(seasons: Union[str, int, list]) -> tuple:
+    """
+    Split season values into explicit seasons and season ranges. A value whose end year is not the year after its start year is a range, (ex. '20182025' covers the seasons '20182019' through '20252026').
+
+    Parameters:
+    - `seasons` (str | int | list[str | int]): The season(s) or season range(s).
+
+    Returns:
+    - `tuple`: A frozenset of the explicit seasons and a list of (first, last) season tuples for the ranges.
+    """
+    explicit, ranges = set(), []
+    for season in (seasons if isinstance(seasons, list) else [seasons]):
+        season = int(season)
+        start, end = divmod(season, 10000)
+        if end == start + 1:
+            explicit.add(season)
+        else:
+            ranges.append((start * 10000 + start + 1, end * 10000 + end + 1))
+    return frozenset(explicit), ranges
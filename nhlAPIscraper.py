@@ -4,13 +4,63 @@ Documentation for methods on github [https://github.com/DI0Rdano/NHL-API-Python-
 Follow @DI0Rdano on Twitter/X [https://x.com/DI0Rdano].
 """
 
-from dataclasses import dataclass
-from typing import Union, Any
-from generalFunctions import make_api_request, construct_sorting_params, construct_cayenne_exp, construct_fact_cayenne_exp, filter_view, filter_json_data, format_date, format_month, get_nested_value, convert_time_to_seconds
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Union, Any, ClassVar, Mapping
+from generalFunctions import make_api_request, make_api_requests, iter_api_requests, clear_response_cache, save_response_cache, load_response_cache, memoize_response, construct_url, encode_query, construct_sorting_params, construct_cayenne_exp, construct_fact_cayenne_exp, construct_filter_cayenne_exp, filter_view, filter_json_data, filter_json_fields, sort_json_data, format_date, format_month, normalize_seasons, to_list, normalize_sort_args, get_nested_value, convert_time_to_seconds
+
+# Unpack the parameters each method reads from the merged params, every key is seeded by default_params
+_get_request_params = itemgetter("view", "validation", "return_info", "timeout", "retries", "backoff")
+_get_list_params = itemgetter("sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff")
+_get_players_params = itemgetter("player_limit", "is_active", "sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff")
+_get_roster_seasons_params = itemgetter("sort", "direction", "view", "filter_data", "exclude_data", "validation", "return_info", "timeout", "retries", "backoff")
+_get_stats_params = itemgetter("season", "start_season", "end_season", "start_date", "end_date", "min_gp", "max_gp", "sort", "direction", "filter_fields", "view", "validation", "return_info", "timeout", "retries", "backoff")
+_get_player_totals = itemgetter("active_players", "inactive_players", "total_players")
+
+# Fields of the shiftcharts endpoint that can be filtered on server side through cayenneExp
+_SHIFTCHART_FIELDS = frozenset(("id", "detailCode", "duration", "endTime", "eventDescription", "eventDetails", "eventNumber", "firstName", "gameId", "hexValue", "lastName", "period", "playerId", "shiftNumber", "startTime", "teamAbbrev", "teamId", "teamName", "typeCode"))
+
+def _postprocess_list(data: list, filter_data: dict = None, exclude_data: dict = None, sort: list = None, direction: list = None, filter_fields: list = None) -> list:
+    """Filter, sort and project a list of JSON objects in that order, `sort`, `direction` and `filter_fields` are expected to be normalized to lists."""
+    data = filter_json_data(data, filter_data, exclude_filters=exclude_data)
+    if sort:
+        sort_json_data(data, sort, direction)
+    if filter_fields:
+        data = filter_json_fields(data, filter_fields)
+    return data
+
+def _build_return(response: Any, return_info: bool, url: str, view: str, fields: list, sort: Union[str, list], direction: Union[str, list], **filters: Any) -> Any:
+    """Return the response, or the response wrapped with the request information when `return_info` is set, `filters` are added between the fields and the sort. The sort is only normalized when it is returned."""
+    if not return_info:
+        return response
+    sort, direction = normalize_sort_args(sort, direction)
+    return {"path": url, "view": view, "fields": fields, **filters, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": response}
+
+def _iter_stats_pages(first_page: dict, url_prefix: str, timeout: int, retries: int, backoff: float, validation: bool, cache: bool, filter_fields: list):
+    """Yield the projected rows of each stats page in order, starting with the already fetched first page. Raises a RuntimeError naming the starting position of a page that fails."""
+    page_data = first_page.get("data", [])
+    yield _postprocess_list(page_data, filter_fields=filter_fields)
+
+    page_size, total = len(page_data), first_page.get("total", 0)
+    if not 0 < page_size < total:
+        return
+    starts = range(page_size, total, page_size)
+    pages = iter_api_requests([f"{url_prefix}{start}" for start in starts], timeout, retries, backoff, validation, cache=cache)
+    for start, page in zip(starts, pages):
+        if page is None:
+            raise RuntimeError(f"Failed to fetch the stats page at start={start}, the stream is incomplete.")
+        yield _postprocess_list(page.get("data", []), filter_fields=filter_fields)
 
-@dataclass
 class nhlAPI:
-    base_urls = {
+    """
+    Static methods wrapping the NHL API endpoints.
+    `default_params` and `report_params` are read-only mappings, assigning to them raises a TypeError. Pass overrides as keyword arguments to the methods instead.
+    """
+    __slots__ = ()
+
+    base_urls: ClassVar[dict] = {
         "config": "https://api.nhle.com/stats/rest/en/config",
         "country": "https://api.nhle.com/stats/rest/en/country?",
         "franchise": "https://api.nhle.com/stats/rest/en/franchise?",
@@ -38,7 +88,20 @@ class nhlAPI:
         "record_menu": "https://records.nhl.com/site/api/nhl/menu?cayenneExp=parent=null&include=children&include=children.children",
         "playoffs_carousel": "https://api-web.nhle.com/v1/playoff-series/carousel/" #TODO playoffs_carousel  
     }
-    default_params = {
+    # Base URLs resolved once for the methods that build their paths from them
+    _SEARCH_PLAYER_URL: ClassVar[str] = base_urls["search_player"]
+    _ROSTER_URL: ClassVar[str] = base_urls["roster"]
+    _ROSTER_SEASON_URL: ClassVar[str] = base_urls["roster_season"]
+    _PLAYER_URL: ClassVar[str] = base_urls["player"]
+    _SCHEDULE_CALENDAR_URL: ClassVar[str] = base_urls["schedule_calendar"]
+    _SCHEDULE_URL: ClassVar[str] = base_urls["schedule"]
+    _STANDINGS_URL: ClassVar[str] = base_urls["standings"]
+    _STANDINGS_SEASON_URL: ClassVar[str] = base_urls["standings_season"]
+    _SCORE_URL: ClassVar[str] = base_urls["score"]
+    _GAMECENTER_URL: ClassVar[str] = base_urls["gamecenter"]
+    _SHIFTCHARTS_URL: ClassVar[str] = base_urls["shiftcharts"]
+    _STATS_URL: ClassVar[str] = base_urls["stats"]
+    default_params: ClassVar[Mapping[str, Any]] = MappingProxyType({
         "season": None,
         "start_season": None,
         "end_season": None,
@@ -77,10 +140,12 @@ class nhlAPI:
         "validation": False,
         "timeout": 10,
         "retries": 3,
-        "backoff": 0.3
-    }
-    report_params = {
-        "skater": {
+        "backoff": 0.3,
+        "cache": False,
+        "stream": False
+    }) # Read-only, merge with kwargs into a new dict per call
+    report_params: ClassVar[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+        "skater": MappingProxyType({
             "position": None,
             "shoots_catches": None,
             "player_name": None,
@@ -92,8 +157,8 @@ class nhlAPI:
             "is_active": None,
             "is_in_hall_of_fame": None,
             "limit": 100,
-        },
-        "goalie": {
+        }),
+        "goalie": MappingProxyType({
             "shoots_catches": None,
             "player_name": None,
             "nationality_code": None,
@@ -104,13 +169,55 @@ class nhlAPI:
             "is_active": None,
             "is_in_hall_of_fame": None,
             "limit": 100,
-        },
-        "team": {
+        }),
+        "team": MappingProxyType({
             "limit": 50,
-        }
-    }
+        })
+    }) # Read-only, merged per call in get_stats
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the cached API responses used to revalidate repeat requests with 'If-None-Match' / 'If-Modified-Since'.
+        """
+        clear_response_cache()
+
+    @staticmethod
+    def save_cache(path: str) -> int:
+        """
+        Save the cached API responses to a SQLite file, so a later session can revalidate them instead of downloading them again.
+
+        Parameters:
+        - `path` (str): The path of the SQLite file, created if it does not exist.
+
+        Returns:
+        - `int`: The number of responses saved.
+        """
+        return save_response_cache(path)
+
+    @staticmethod
+    def load_cache(path: str) -> int:
+        """
+        Load API responses saved with save_cache. Requests for unchanged resources are then answered with '304 Not Modified' and reuse the saved response.
+
+        Parameters:
+        - `path` (str): The path of the SQLite file.
+
+        Returns:
+        - `int`: The number of responses loaded.
+        """
+        return load_response_cache(path)
+
+    @staticmethod
+    def invalidate_metadata_cache() -> None:
+        """
+        Clear the memoized results of the metadata methods (get_config, get_countries, get_franchises, get_seasons, get_draftrounds) so the next call fetches them again.
+        """
+        for method in (nhlAPI.get_config, nhlAPI.get_countries, nhlAPI.get_franchises, nhlAPI.get_seasons, nhlAPI.get_draftrounds):
+            method.cache_clear()
 
     @staticmethod
+    @memoize_response
     def get_config(**kwargs: Any) -> dict:
         """
         Fetch data from the NHL API 'config' endpoint.
@@ -128,11 +235,9 @@ class nhlAPI:
         Returns:
         - `json` (dict | None): Configuration data with relevant fields for the stats endpoint.
         """
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["view", "validation", "return_info", "timeout", "retries", "backoff"]
-        view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        view, validation, return_info, timeout, retries, backoff = _get_request_params(params)
 
         url = nhlAPI.base_urls.get("config")
         data = make_api_request(url, timeout, retries, backoff, validation)
@@ -145,6 +250,7 @@ class nhlAPI:
         return {"path": url, "view": view, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
+    @memoize_response
     def get_countries(include_state_provinces: bool = True, **kwargs: Any) -> dict:
         """
         Fetch JSON data from the NHL API 'country' endpoint.
@@ -171,35 +277,29 @@ class nhlAPI:
         - `json` (dict | None): Country data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
+        sort, direction = normalize_sort_args(sort, direction, validation)
 
-        url = nhlAPI.base_urls.get("country")
-        url += construct_sorting_params(sort, direction, validation) if sort is not None else ""
-        url += "&" if sort is not None and include_state_provinces else ""
-        url += "include=stateProvinces" if include_state_provinces else ""
-
-        if filter_fields:
-            url += "&" if sort is not None or include_state_provinces else ""
-            url += f"include={filter_fields}" if isinstance(filter_fields, str) else ""
-            url += "&".join([f"include={field}" for field in filter_fields]) if isinstance(filter_fields, list) else ""
+        includes = ["stateProvinces"] if include_state_provinces else []
+        url = construct_url(nhlAPI.base_urls.get("country"), sort_param=construct_sorting_params(sort, direction, validation) if sort is not None else None, includes=includes, filter_fields=filter_fields)
 
         data = make_api_request(url, timeout, retries, backoff, validation)
 
         if data is None:
             return None
             
-        filtered_data = filter_json_data(data.get("data", []), filter_data) if filter_data is not None else data.get("data", [])
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else {**filtered_data, "total": len(filtered_data["data"])}
-        sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
+        filtered_data = {"data": filter_json_data(data.get("data", []), filter_data, exclude_filters=exclude_data)}
+        if view is not None:
+            filtered_data = filter_view(filtered_data, view, validation)
+        else:
+            filtered_data["total"] = len(filtered_data["data"])
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
+    @memoize_response
     def get_franchises(include_first_season: bool = True, include_last_season: bool = True, **kwargs: Any) -> dict:
         """
         Fetch JSON data from the NHL API 'franchise' endpoint.
@@ -227,39 +327,28 @@ class nhlAPI:
         - `json` (dict | None): Franchise data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
+        sort, direction = normalize_sort_args(sort, direction, validation)
 
-        url = nhlAPI.base_urls.get("franchise")
-        url += construct_sorting_params(sort, direction, validation) if sort is not None else ""
-
-        if include_first_season:
-            url += "&" if sort is not None else ""
-            url += "include=firstSeason"
-        if include_last_season:
-            url += "&" if sort is not None or include_first_season is not None else ""
-            url += "include=lastSeason"
-
-        if filter_fields:
-            url += "&" if sort is not None or include_first_season or include_last_season else ""
-            url += f"include={filter_fields}" if isinstance(filter_fields, str) else ""
-            url += "&".join([f"include={field}" for field in filter_fields]) if isinstance(filter_fields, list) else ""
+        includes = [field for field, include in (("firstSeason", include_first_season), ("lastSeason", include_last_season)) if include]
+        url = construct_url(nhlAPI.base_urls.get("franchise"), sort_param=construct_sorting_params(sort, direction, validation) if sort is not None else None, includes=includes, filter_fields=filter_fields)
 
         data = make_api_request(url, timeout, retries, backoff, validation)
         if data is None:
             return None
         
-        filtered_data = filter_json_data(data.get("data", []), filter_data) if filter_data is not None else data.get("data", [])
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else {**filtered_data, "total": len(filtered_data["data"])}
-        sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
+        filtered_data = {"data": filter_json_data(data.get("data", []), filter_data, exclude_filters=exclude_data)}
+        if view is not None:
+            filtered_data = filter_view(filtered_data, view, validation)
+        else:
+            filtered_data["total"] = len(filtered_data["data"])
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
+    @memoize_response
     def get_seasons(**kwargs: Any) -> dict:
         """
         Fetch data from the NHL API 'season' endpoint.
@@ -283,33 +372,28 @@ class nhlAPI:
         - `json` (dict | None): Available seasons data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
-
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        url = nhlAPI.base_urls.get("season")
-        url += construct_sorting_params(sort, direction, validation) if sort is not None else ""
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
+        sort, direction = normalize_sort_args(sort, direction, validation)
 
-        if filter_fields:
-            url += "&" if sort is not None else ""
-            url += f"include={filter_fields}" if isinstance(filter_fields, str) else ""
-            url += "&".join([f"include={field}" for field in filter_fields]) if isinstance(filter_fields, list) else ""
+        url = construct_url(nhlAPI.base_urls.get("season"), sort_param=construct_sorting_params(sort, direction, validation) if sort is not None else None, filter_fields=filter_fields)
 
         data = make_api_request(url, timeout, retries, backoff, validation)
 
         if data is None:
             return None
             
-        filtered_data = filter_json_data(data.get("data", []), filter_data) if filter_data is not None else data.get("data", [])
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else {**filtered_data, "total": len(filtered_data["data"])}
-        sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
+        filtered_data = {"data": filter_json_data(data.get("data", []), filter_data, exclude_filters=exclude_data)}
+        if view is not None:
+            filtered_data = filter_view(filtered_data, view, validation)
+        else:
+            filtered_data["total"] = len(filtered_data["data"])
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
+    @memoize_response
     def get_draftrounds(**kwargs: Any) -> dict:
         """
         Fetch data from the NHL API 'draft' endpoint.
@@ -333,31 +417,25 @@ class nhlAPI:
         - `json` (dict | None): Draft round data.
         """
         
-        params = nhlAPI.default_params
-        params.update(kwargs)
-
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        url = nhlAPI.base_urls.get("draft")
-        url += construct_sorting_params(sort, direction, validation) if sort is not None else ""
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
+        sort, direction = normalize_sort_args(sort, direction, validation)
 
-        if filter_fields:
-            url += "&" if sort is not None else ""
-            url += f"include={filter_fields}" if isinstance(filter_fields, str) else ""
-            url += "&".join([f"include={field}" for field in filter_fields]) if isinstance(filter_fields, list) else ""
+        url = construct_url(nhlAPI.base_urls.get("draft"), sort_param=construct_sorting_params(sort, direction, validation) if sort is not None else None, filter_fields=filter_fields)
 
         data = make_api_request(url, timeout, retries, backoff, validation)
 
         if data is None:
             return None
             
-        filtered_data = filter_json_data(data.get("data", []), filter_data) if filter_data is not None else data.get("data", [])
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else {**filtered_data, "total": len(filtered_data["data"])}
-        sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
+        filtered_data = {"data": filter_json_data(data.get("data", []), filter_data, exclude_filters=exclude_data)}
+        if view is not None:
+            filtered_data = filter_view(filtered_data, view, validation)
+        else:
+            filtered_data["total"] = len(filtered_data["data"])
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
     def get_players(**kwargs: Any) -> dict:
@@ -385,16 +463,14 @@ class nhlAPI:
         - `json` (dict | None): Players bio data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["player_limit", "is_active", "sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        player_limit, is_active, sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
-        active_players, inactive_players, total_players = (params.get(param) for param in ("active_players", "inactive_players", "total_players"))
+        player_limit, is_active, sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_players_params(params)
+        active_players, inactive_players, total_players = _get_player_totals(params)
 
         limit = player_limit if player_limit is not None else (active_players if is_active else (total_players if is_active is None else inactive_players))
 
-        base_url = nhlAPI.base_urls.get("search_player")
+        base_url = nhlAPI._SEARCH_PLAYER_URL
         url = f"{base_url}&limit={limit}&q=%2A"
         url += f"&active={is_active}" if is_active is not None else ""
         data = make_api_request(url, timeout, retries, backoff, validation)
@@ -402,22 +478,22 @@ class nhlAPI:
         if data is None:
             return None
 
-        if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data.sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+        filtered_data = {"data": filter_json_data(data, filter_data, exclude_filters=exclude_data)}
+
+        if sort: # Sort after filtering so only the kept players are sorted
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(filtered_data["data"], sort, direction)
 
-        filtered_data = filter_json_data(data, filter_data) if filter_data is not None else data
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            filtered_data["data"] = [{key: player[key] for key in filter_fields if key in player} for player in filtered_data["data"]]
+            filter_fields = to_list(filter_fields)
+            filtered_data["data"] = filter_json_fields(filtered_data["data"], filter_fields)
 
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else {**filtered_data, "total": len(filtered_data["data"])}
+        if view is not None:
+            filtered_data = filter_view(filtered_data, view, validation)
+        else:
+            filtered_data["total"] = len(filtered_data["data"])
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
     def get_roster(team_code: str = "TOR", season: str = "20232024", **kwargs: Any) -> dict:
@@ -447,42 +523,61 @@ class nhlAPI:
         - `json` (dict | None): Team roster data for a specific season.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
-        base_url = nhlAPI.base_urls.get("roster")
-        url = f"{base_url}{team_code}/{season}"
+        url = f"{nhlAPI._ROSTER_URL}{team_code}/{season}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
+        if data["data"] is None:
+            return None
+
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                for pos_group in data["data"]:
-                    data["data"][pos_group].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            for pos_group in data["data"]:
+                sort_json_data(data["data"][pos_group], sort, direction)
 
         total = 0
         for pos_group in data["data"]:
-            position_group_data = data["data"][pos_group]
-            if filter_data is not None:
-                position_group_data = filter_json_data(position_group_data, filter_data)
-            if exclude_data is not None:
-                position_group_data = filter_json_data(position_group_data, exclude_data, exclude=True)
+            position_group_data = filter_json_data(data["data"][pos_group], filter_data, exclude_filters=exclude_data)
             data["data"][pos_group] = position_group_data
             total += len(position_group_data)
 
         if filter_fields:
+            filter_fields = to_list(filter_fields)
             for pos_group in data["data"]:
-                filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-                data["data"][pos_group] = [{key: player[key] for key in filter_fields if key in player} for player in data["data"][pos_group]]
+                data["data"][pos_group] = filter_json_fields(data["data"][pos_group], filter_fields)
 
         data["data"]["total"] = total
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+
+    @staticmethod
+    def get_rosters_bulk(team_codes: Union[str, list], seasons: Union[str, list], max_workers: int = 8, **kwargs: Any) -> dict:
+        """
+        Fetch the rosters for every combination of teams and seasons concurrently, using get_roster for each.
+
+        Parameters:
+        - `team_codes` (str | list[str]): The abbreviated code(s) of the teams, (ex. ['TOR', 'MTL']).
+        - `seasons` (str | list[str]): The season(s) in the format of '20232024'.
+
+        Optional Parameters:
+        - `max_workers` (int): The max number of rosters fetched at the same time. Default is '8'.
+        - Any parameter accepted by get_roster, applied to every roster.
+
+        Returns:
+        - `dict`: Maps each (team_code, season) tuple to the response of get_roster, or None if the roster could not be fetched (e.g., a team that did not exist that season).
+        """
+        team_codes = to_list(team_codes)
+        seasons = to_list(seasons)
+        pairs = [(team_code, season) for team_code in team_codes for season in seasons]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            rosters = list(executor.map(lambda pair: nhlAPI.get_roster(*pair, **kwargs), pairs))
+
+        return dict(zip(pairs, rosters))
 
     @staticmethod
     def get_roster_seasons(team_code: str = "MTL", **kwargs: Any) -> dict:
@@ -496,8 +591,8 @@ class nhlAPI:
         - `sort` (bool | None): Boolean flag to enable sorting. Default is 'None'.
         - `direction` (str | list[str] | None): Direction of sorting. Default is 'None'.
         - `view` (str | None): To drilldown the JSON dictionary, use '.' as a delimiter for subfields. Default is 'None' which returns everything.
-        - `filter_data` (str | int | list [str, int] | None): Seasons to include in the response. Default is 'None' which returns everything.
-        - `exclude_data` (str | int | list [str, int] | None): Seasons to exclude from the response. Default is 'None' which excludes nothing.
+        - `filter_data` (str | int | list [str, int] | None): Seasons to include in the response, a value like '20182025' includes the seasons '20182019' through '20252026'. Default is 'None' which returns everything.
+        - `exclude_data` (str | int | list [str, int] | None): Seasons to exclude from the response, a value like '20182025' excludes the seasons '20182019' through '20252026'. Default is 'None' which excludes nothing.
 
         Additional Parameters:
         - `return_info` (bool): Flag to return additional information along with the response. Default is 'False'.
@@ -510,35 +605,30 @@ class nhlAPI:
         - `json` (list | None): Team roster seasons data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["sort", "direction", "view", "filter_data", "exclude_data", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, view, filter_data, exclude_data, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, view, filter_data, exclude_data, validation, return_info, timeout, retries, backoff = _get_roster_seasons_params(params)
 
-        base_url = nhlAPI.base_urls.get("roster_season")
-        url = f"{base_url}{team_code}"
+        url = f"{nhlAPI._ROSTER_SEASON_URL}{team_code}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
-        if exclude_data is not None: #TODO make it handle range like 20182025
-            if not isinstance(exclude_data, list):
-                exclude_data = [exclude_data]
-            exclude_data = [int(exclude) for exclude in exclude_data]
-            data["data"] = [season for season in data["data"] if season not in exclude_data]
+        if exclude_data is not None:
+            excluded, excluded_ranges = normalize_seasons(exclude_data)
+            data["data"] = [season for season in data["data"] if season not in excluded and not any(first <= season <= last for first, last in excluded_ranges)]
 
-        if filter_data is not None: #TODO make it handle range like 20182025
-            if not isinstance(filter_data, list):
-                filter_data = [filter_data]
-            filter_data = [int(season) for season in filter_data]
-            data["data"] = [season for season in data["data"] if season in filter_data]
+        if filter_data is not None:
+            included, included_ranges = normalize_seasons(filter_data)
+            data["data"] = [season for season in data["data"] if season in included or any(first <= season <= last for first, last in included_ranges)]
 
         if sort:
-            direction = [direction] if isinstance(direction, str) else direction
-            for d in reversed(list(direction)):
-                reverse = d.upper() == 'DESC'
-                data["data"].sort(key=lambda x: (x is None, x), reverse=reverse)
+            direction = [direction] if isinstance(direction, str) else (direction or ["ASC"])
+            data["data"].sort(key=lambda x: (x is None, x), reverse=direction[0].upper() == "DESC") # Every pass sorted by the season itself, so only the first direction decides the order
 
-        filtered_data = filter_view(data, view, validation) if view is not None else {**data, "total": len(data["data"])}
+        if view is not None:
+            filtered_data = filter_view(data, view, validation)
+        else:
+            data["total"] = len(data["data"])
+            filtered_data = data
 
         return {"path": url, "view": view, "filters": filter_data, "exclude": exclude_data, "sort": direction if sort else sort, "response": filtered_data} if return_info else filtered_data
 
@@ -569,36 +659,50 @@ class nhlAPI:
         - `json` (dict | None): Player landing data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
         player_id = int(player_id)
-        base_url = nhlAPI.base_urls.get("player")
-        url = f"{base_url}{player_id}/landing"
+        url = f"{nhlAPI._PLAYER_URL}{player_id}/landing"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
-        if data is None:
+        if data["data"] is None:
             return None
         
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["seasonTotals"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(data["data"]["seasonTotals"], sort, direction)
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            data["data"]["seasonTotals"] = [{key: player[key] for key in filter_fields if key in player} for player in data["data"]["seasonTotals"]]
+            filter_fields = to_list(filter_fields)
+            data["data"]["seasonTotals"] = filter_json_fields(data["data"]["seasonTotals"], filter_fields)
 
-        data["data"]["seasonTotals"] = filter_json_data(data["data"]["seasonTotals"], filter_data) if filter_data is not None else data["data"]["seasonTotals"]
-        data["data"]["seasonTotals"] = filter_json_data(data["data"]["seasonTotals"], exclude_data, exclude=True) if exclude_data is not None else data["data"]["seasonTotals"]
+        data["data"]["seasonTotals"] = filter_json_data(data["data"]["seasonTotals"], filter_data, exclude_filters=exclude_data)
 
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+
+    @staticmethod
+    def get_player_landings_bulk(player_ids: list, max_workers: int = 8, **kwargs: Any) -> dict:
+        """
+        Fetch the landing data for multiple players concurrently, using get_player_landing for each.
+
+        Parameters:
+        - `player_ids` (list[int | str]): The unique identifiers of the players, (ex. [8478402, 8479318]).
+
+        Optional Parameters:
+        - `max_workers` (int): The max number of players fetched at the same time. Default is '8'.
+        - Any parameter accepted by get_player_landing, applied to every player.
+
+        Returns:
+        - `dict`: Maps each player_id to the response of get_player_landing, or None if the player could not be fetched.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            landings = list(executor.map(lambda player_id: nhlAPI.get_player_landing(player_id, **kwargs), player_ids))
+
+        return dict(zip(player_ids, landings))
 
     @staticmethod
     def get_player_gamelog(player_id: Union[int, str], season: Union[int, str] = "20232024", game_type: Union[int, str] = 2, **kwargs: Any) -> dict:
@@ -629,37 +733,33 @@ class nhlAPI:
         - `json` (dict | None): Player gamelog data based on the specified view.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
         season = str(season)
         game_type = int(game_type)
         player_id = int(player_id)
-        base_url = nhlAPI.base_urls.get("player")
-        url = f"{base_url}{player_id}/game-log/{season}/{game_type}"
+        url = f"{nhlAPI._PLAYER_URL}{player_id}/game-log/{season}/{game_type}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
-        if data is None:
+        if data["data"] is None:
             return None
 
+        game_log = filter_json_data(data["data"].get("gameLog", []), filter_data, exclude_filters=exclude_data)
+
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["gameLog"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(game_log, sort, direction)
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            data["data"]["gameLog"] = [{key: player[key] for key in filter_fields if key in player} for player in data["data"]["gameLog"]]
+            filter_fields = to_list(filter_fields)
+            game_log = filter_json_fields(game_log, filter_fields)
 
-        filtered_data = {"data": {"seasonId": data.get("data", []).get("seasonId"), "gameTypeId": data.get("data", []).get("gameTypeId"), "playerStatsSeasons": data.get("data", []).get("playerStatsSeasons", []), "gameLog": filter_json_data(data.get("data", []).get("gameLog", []), filter_data)}} if filter_data is not None else data
-        filtered_data = {"data": {"seasonId": data.get("data", []).get("seasonId"), "gameTypeId": data.get("data", []).get("gameTypeId"), "playerStatsSeasons": data.get("data", []).get("playerStatsSeasons", []), "gameLog": filter_json_data(data.get("data", []).get("gameLog", []), exclude_data, exclude=True)}} if exclude_data is not None else filtered_data
-        filtered_data = filter_view(filtered_data, view, validation) if view is not None else filtered_data
+        data["data"]["gameLog"] = game_log
+        filtered_data = filter_view(data, view, validation) if view is not None else data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
     def get_schedule_calendar(date: str = "now", **kwargs: Any) -> dict:
@@ -680,14 +780,11 @@ class nhlAPI:
         - `json` (dict | None): Schedule calendar data.
         """
         
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["view", "validation", "return_info", "timeout", "retries", "backoff"]
-        view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        view, validation, return_info, timeout, retries, backoff = _get_request_params(params)
 
-        base_url = nhlAPI.base_urls.get("schedule_calendar")
-        url = f"{base_url}now" if date == "now" else f"{base_url}{date}"
+        url = f"{nhlAPI._SCHEDULE_CALENDAR_URL}{date}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
         if data is None:
@@ -717,30 +814,25 @@ class nhlAPI:
         """
 
         #TODO inplement filter/exclude data
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
-        base_url = nhlAPI.base_urls.get("schedule")
-        url = f"{base_url}now" if date == "now" else f"{base_url}{date}"
+        url = f"{nhlAPI._SCHEDULE_URL}{date}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
         if data is None:
             return None
 
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                for game in data["data"]["gameWeek"]:
-                        game["games"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            for game in data["data"]["gameWeek"]:
+                sort_json_data(game["games"], sort, direction)
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
+            filter_fields = to_list(filter_fields)
             for games in data["data"]["gameWeek"]:
-                games["games"] = [{key: game[key] for key in filter_fields if key in game} for game in games["games"]]
+                games["games"] = filter_json_fields(games["games"], filter_fields)
 
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
@@ -773,33 +865,27 @@ class nhlAPI:
         - `json` (dict | None): Standings data for a provided date.
         """
         
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
-        base_url = nhlAPI.base_urls.get("standings")
-        url = f"{base_url}now" if date == "now" else f"{base_url}{date}"
+        url = f"{nhlAPI._STANDINGS_URL}{date}"
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["standings"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(data["data"]["standings"], sort, direction)
 
-        filtered_data = filter_json_data(data["data"]["standings"], filter_data) if filter_data is not None else data["data"]["standings"]
-        filtered_data = {"data":{"wildCardIncicator": data["data"].get("wildCardIndicator", {}), "standings": filter_json_data(filtered_data, exclude_data, exclude=True)}} if exclude_data is not None else {"data":{"wildCardIndicator": data["data"].get("wildCardIndicator", {}), "standings": filtered_data}}
+        filtered_data = {"data":{"wildCardIndicator": data["data"].get("wildCardIndicator", {}), "standings": filter_json_data(data["data"]["standings"], filter_data, exclude_filters=exclude_data)}}
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            filtered_data["data"]["standings"] = [{key: team[key] for key in filter_fields if key in team} for team in filtered_data["data"]["standings"]]
+            filter_fields = to_list(filter_fields)
+            filtered_data["data"]["standings"] = filter_json_fields(filtered_data["data"]["standings"], filter_fields)
 
         filtered_data["data"]["total"] = len(filtered_data["data"]["standings"])
         filtered_data = filter_view(filtered_data, view, validation) if view is not None else filtered_data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
     def get_standings_seasons(**kwargs: Any) -> dict:
@@ -825,33 +911,27 @@ class nhlAPI:
         - `json` (dict | None): NHL standings available seasons data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
-        url = nhlAPI.base_urls.get("standings_season")
+        url = nhlAPI._STANDINGS_SEASON_URL
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["seasons"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(data["data"]["seasons"], sort, direction)
 
-        filtered_data = filter_json_data(data["data"]["seasons"], filter_data) if filter_data is not None else data["data"]["seasons"]
-        #TODO troubleshoot excluding by fields with a bool value of 'false' which doesnt work even though it works for bool values of 'true'.
-        filtered_data = {"data":{"currentDate": data["data"].get("currentDate", {}), "seasons": filter_json_data(filtered_data, exclude_data, exclude=True)}} if exclude_data is not None else {"data":{"currentDate": data["data"].get("currentDate", {}), "seasons": filtered_data}}
+        filtered_data = {"data":{"currentDate": data["data"].get("currentDate", {}), "seasons": filter_json_data(data["data"]["seasons"], filter_data, exclude_filters=exclude_data)}}
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            filtered_data["data"]["seasons"] = [{key: season[key] for key in filter_fields if key in season} for season in filtered_data["data"]["seasons"]]
+            filter_fields = to_list(filter_fields)
+            filtered_data["data"]["seasons"] = filter_json_fields(filtered_data["data"]["seasons"], filter_fields)
 
         filtered_data["data"]["total"] = len(filtered_data["data"]["seasons"])
         filtered_data = filter_view(filtered_data, view, validation) if view is not None else filtered_data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod 
     def get_scores(date: str = "now", **kwargs: Any) -> dict:
@@ -871,26 +951,21 @@ class nhlAPI:
         Returns:
         - `json` (dict | None): Scores data.
         """
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
 
         #TODO implement filter/exclude data
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
-        base_url = nhlAPI.base_urls.get("score")
-        url = f"{base_url}now" if date == "now" else f"{base_url}{date}"
+        url = f"{nhlAPI._SCORE_URL}{date}"
         data = {"data":make_api_request(url, timeout, retries, backoff, validation)}
 
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)            
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["games"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(data["data"]["games"], sort, direction)
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            data["data"]["games"] = [{key: game[key] for key in filter_fields if key in game} for game in data["data"]["games"]]
+            filter_fields = to_list(filter_fields)
+            data["data"]["games"] = filter_json_fields(data["data"]["games"], filter_fields)
 
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
@@ -923,15 +998,12 @@ class nhlAPI:
         - `json` (dict | None): Play by play data.
         """
         
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
         game_id = int(game_id)
-        base_url = nhlAPI.base_urls.get("gamecenter")
-        url = f"{base_url}{game_id}/play-by-play"
+        url = f"{nhlAPI._GAMECENTER_URL}{game_id}/play-by-play"
 
         data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
 
@@ -939,21 +1011,18 @@ class nhlAPI:
             return None
 
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)            
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                data["data"]["plays"].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
+            sort, direction = normalize_sort_args(sort, direction, validation)
+            sort_json_data(data["data"]["plays"], sort, direction)
 
         if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            data["data"]["plays"] = [{key: play[key] for key in filter_fields if key in play} for play in data["data"]["plays"]]
+            filter_fields = to_list(filter_fields)
+            data["data"]["plays"] = filter_json_fields(data["data"]["plays"], filter_fields)
 
-        data["data"]["plays"] = filter_json_data(data["data"]["plays"], filter_data) if filter_data is not None else data["data"]["plays"]
-        data["data"]["plays"] = filter_json_data(data["data"]["plays"], exclude_data, exclude=True) if exclude_data is not None else data["data"]["plays"]
+        data["data"]["plays"] = filter_json_data(data["data"]["plays"], filter_data, exclude_filters=exclude_data)
 
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": dict(zip(sort, direction)) if sort is not None else None, "response": filtered_data} if return_info else filtered_data
 
     @staticmethod
     def get_boxscore(game_id: Union[int, str], **kwargs: Any) -> dict:
@@ -977,51 +1046,35 @@ class nhlAPI:
         - `timeout` (int): The timeout duration for the request in seconds. Default is '10'.
         - `retries` (int): The number of retry attempts in case of failure. Default is '3'.
         - `backoff` (float): The delay before the next retry attempt in seconds. Default is '0.3'.
+        - `cache` (bool): Flag to reuse a previously fetched response without contacting the API, for finished games. Default is 'False'.
 
         Returns:
         - `json` (dict | None): Boxscore data.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
 
         game_id = int(game_id)
-        base_url = nhlAPI.base_urls.get("gamecenter")
-        url = f"{base_url}{game_id}/boxscore"
-        data = {"data": make_api_request(url, timeout, retries, backoff, validation)}
+        url = f"{nhlAPI._GAMECENTER_URL}{game_id}/boxscore"
+        data = {"data": make_api_request(url, timeout, retries, backoff, validation, cache=params["cache"])}
 
         if data["data"] is None:
             return None
         
         if sort:
-            sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)            
-            for s, d in reversed(list(zip(sort, direction))):
-                reverse = d.upper() == 'DESC'
-                for team in data["data"]["playerByGameStats"]:
-                    for pos_group in data["data"]["playerByGameStats"][team]:
-                        data["data"]["playerByGameStats"][team][pos_group].sort(key=lambda x: (x.get(s) is None, x.get(s)), reverse=reverse)
-
-        for team in data["data"]["playerByGameStats"]:   
-            for pos_group in data["data"]["playerByGameStats"][team]:
-                position_group_data = data["data"]["playerByGameStats"][team][pos_group]
-                if filter_data is not None:
-                    position_group_data = filter_json_data(position_group_data, filter_data)
-                if exclude_data is not None:
-                    position_group_data = filter_json_data(position_group_data, exclude_data, exclude=True)
-                data["data"]["playerByGameStats"][team][pos_group] = position_group_data
-
+            sort, direction = normalize_sort_args(sort, direction, validation)
         if filter_fields:
-            for team in data["data"]["playerByGameStats"]:
-                for pos_group in data["data"]["playerByGameStats"][team]:
-                    filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-                    data["data"]["playerByGameStats"][team][pos_group] = [{key: player[key] for key in filter_fields if key in player} for player in data["data"]["playerByGameStats"][team][pos_group]]
+            filter_fields = to_list(filter_fields)
+
+        for team_data in data["data"]["playerByGameStats"].values(): # Filter, sort and project each position group in a single visit
+            for pos_group, players in team_data.items():
+                team_data[pos_group] = _postprocess_list(players, filter_data, exclude_data, sort, direction, filter_fields)
 
         filtered_data = filter_view(data, view, validation) if view is not None else data
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+        return _build_return(filtered_data, return_info, url, view, filter_fields, sort, direction, filters=filter_data, exclude=exclude_data)
 
     @staticmethod 
     def get_shifts(game_id: Union[int, str], **kwargs: Any) -> dict:
@@ -1034,44 +1087,54 @@ class nhlAPI:
         Optional Parameters:
         - `sort` (str | None): The field to sort the data by. Default is 'None'.
         - `direction` (str | None): The sorting direction. Default is 'None'.
+        - `filter_fields` (str | list[str] | None): The fields to include. Default is 'None' which returns all fields.
+        - `filter_data` (dict | None): Dictionary containing filter parameters and their corresponding values. Default is 'None' which returns everything.
+        - `exclude_data` (dict | None): Dictionary containing filter parameters and their corresponding values to exclude from the response. Default is 'None' which excludes nothing.
         - `view` (str | None): The part of the json to return, use '.' as a delimiter for subfields. Default is 'None' (to return everything).
 
         Additional Parameters:
         - `return_info` (bool): Flag to return the API path along with the response. Default is 'False'.
         - `validation` (bool): Flag to enable/disable input validation. Default is 'False'.
+        - `cache` (bool): Flag to reuse a previously fetched response without contacting the API, for finished games. Default is 'False'.
 
         Returns:
-        - `json` (dict | None): Shift data for a specific game.
+        - `json` (dict | None): Shift data for a specific game, with the total after filtering.
         """
 
-        params = nhlAPI.default_params
-        params.update(kwargs)
+        params = {**nhlAPI.default_params, **kwargs}
         
-        input_params = ["sort", "direction", "filter_fields", "filter_data", "exclude_data", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = (params.get(param) for param in input_params)
+        sort, direction, filter_fields, filter_data, exclude_data, view, validation, return_info, timeout, retries, backoff = _get_list_params(params)
+        filter_fields = to_list(filter_fields)
 
         game_id = int(game_id)
-        base_url = nhlAPI.base_urls.get("shiftcharts")
+        base_url = nhlAPI._SHIFTCHARTS_URL
+        sort, direction = normalize_sort_args(sort, direction, validation)
         sort_param = construct_sorting_params(sort, direction, validation) if sort is not None else ""
-        url = f"{base_url}?{sort_param}&cayenneExp=gameId%3E={game_id}" if sort_param else f"{base_url}?cayenneExp=gameId%3E={game_id}"
-        data = make_api_request(url, timeout, retries, backoff, validation)
+
+        # Let the API apply the filters it can, the rest are applied below
+        filter_exp, local_filter_data = construct_filter_cayenne_exp(filter_data, _SHIFTCHART_FIELDS)
+        exclude_exp, local_exclude_data = construct_filter_cayenne_exp(exclude_data, _SHIFTCHART_FIELDS, exclude=True)
+        cayenne_exp = " and ".join(exp for exp in (f"gameId>={game_id}", filter_exp, exclude_exp) if exp)
+        query = encode_query({"cayenneExp": cayenne_exp})
+
+        url = f"{base_url}?{sort_param}&{query}" if sort_param else f"{base_url}?{query}"
+        data = make_api_request(url, timeout, retries, backoff, validation, cache=params["cache"])
 
         if data is None:
             return None
         
-        #TODO troubleshoot
-        filtered_data = filter_json_data(data["data"], filter_data) if filter_data is not None else data["data"]
-        filtered_data = {"data": filter_json_data(filtered_data, exclude_data, exclude=True)} if exclude_data is not None else {"data": filtered_data}
-        
-        #TODO troubleshoot
-        if filter_fields:
-            filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-            filtered_data["data"] = [{key: shift[key] for key in filter_fields if key in shift} for shift in filtered_data["data"]]
+        shifts = _postprocess_list(data["data"], local_filter_data, local_exclude_data, filter_fields=filter_fields) # Sorting is done by the API
+        filtered_data = {"data": shifts, "total": len(shifts)}
         
-        filtered_data = filter_view(data, view, validation) if view is not None else data
-        sort, direction = ([sort], [direction]) if isinstance(sort, str) else (sort, direction)
+        filtered_data = filter_view(filtered_data, view, validation) if view is not None else filtered_data
+
+        return _build_return(filtered_data, return_info, url, view, filter_fields, sort, direction, filters=filter_data, exclude=exclude_data)
 
-        return {"path": url, "view": view, "fields": filter_fields, "filters": filter_data, "exclude": exclude_data, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_report_defaults(key: str) -> Mapping[str, Any]:
+        """Merge default_params with the report_params of a stats key once per key, returned read-only."""
+        return MappingProxyType({**nhlAPI.default_params, **nhlAPI.report_params.get(key, {})})
 
     @staticmethod
     def get_stats(key: str = "skater", report: str = "summary", **kwargs: Any) -> dict:
@@ -1123,62 +1186,68 @@ class nhlAPI:
         - `limit` (int): The max number of players/teams to return if return_all is set to 'False'.  Default is '100'.
         - `start` (int): The starting point of the list to return the players/teams from if return_all is set to 'False'. Default is '0'.
         - `return_all` (bool): Flag to determine whether to return all players/teams or only a single loop with the provided limit. Default is 'True'.
+        - `stream` (bool): Flag to return a generator yielding the players/teams of each page as it arrives instead of a single list, only used when return_all is 'True'. `view` is not applied to the pages, and a RuntimeError naming the `start` of the page is raised if a page after the first fails. Default is 'False'.
         - `return_info` (bool): Flag to return the API path along with the response. Default is 'False'.
         - `validation` (bool): Flag to enable/disable input validation. Default is 'True'.
+        - `cache` (bool): Flag to reuse previously fetched pages without contacting the API, for completed seasons. Default is 'False'.
 
         """
 
-        default_params = {**nhlAPI.default_params, **nhlAPI.report_params.get(key, {})}
-        default_params.update(kwargs)
+        default_params = {**nhlAPI._get_report_defaults(key), **kwargs}
         
-        input_params = ["season", "start_season", "end_season", "start_date", "end_date", "min_gp", "max_gp", "sort", "direction", "filter_fields", "view", "validation", "return_info", "timeout", "retries", "backoff"]
-        season, start_season, end_season, start_date, end_date, min_gp, max_gp, sort, direction, filter_fields, view, validation, return_info, timeout, retries, backoff = (default_params.get(param) for param in input_params)
+        season, start_season, end_season, start_date, end_date, min_gp, max_gp, sort, direction, filter_fields, view, validation, return_info, timeout, retries, backoff = _get_stats_params(default_params)
+        filter_fields = to_list(filter_fields)
+        sort, direction = normalize_sort_args(sort, direction, validation)
         is_game = start_date is not None or end_date is not None
 
-        base_url = nhlAPI.base_urls.get("stats")
+        base_url = nhlAPI._STATS_URL
         cayenneExp = construct_cayenne_exp(season=season, start_season=start_season, end_season=end_season, start_date=start_date, end_date=end_date, default_kwargs=default_params)
         factCayenneExp = construct_fact_cayenne_exp(min_gp=min_gp, max_gp=max_gp, default_kwargs=default_params)
-        params = {"isAggregate": str(default_params.get("aggregate", True)), "isGame": str(is_game), "start": "0", "limit": str(default_params.get("limit", True)), "factCayenneExp": factCayenneExp, "cayenneExp": cayenneExp}
+        params = {"isAggregate": str(default_params.get("aggregate", True)), "isGame": str(is_game), "limit": str(default_params.get("limit", True)), "factCayenneExp": factCayenneExp, "cayenneExp": cayenneExp}
 
         if sort is not None:
             sort_param = construct_sorting_params(sort=sort, direction=direction, validation=validation)
             sort_param = sort_param[len("sort="):] if sort_param.startswith("sort=") else sort_param 
             params["sort"] = sort_param
 
+        url_prefix = f"{base_url}{key}/{report}?{encode_query(params)}&start=" # Encoded once, only the starting position changes between pages
+
         all_data = []
         if default_params.get("return_all", True):
-            while True:
-                url = f"{base_url}{key}/{report}?{'&'.join([f'{key}={value}' for key, value in params.items()])}"
-                data = make_api_request(url, timeout, retries, backoff, validation)
-                if data is None:
+            url = f"{url_prefix}0"
+            data = make_api_request(url, timeout, retries, backoff, validation, cache=default_params["cache"])
+            if data is None:
+                return None
+            if default_params["stream"]:
+                pages = _iter_stats_pages(data, url_prefix, timeout, retries, backoff, validation, default_params["cache"], filter_fields)
+                return _build_return(pages, return_info, url, view, filter_fields, sort, direction)
+            all_data.extend(data.get("data", []))
+
+            # The first page gives the total, request the remaining pages concurrently using its size as the step
+            page_size, total = len(all_data), data.get("total", 0)
+            if 0 < page_size < total:
+                urls = [f"{url_prefix}{start}" for start in range(page_size, total, page_size)]
+                pages = make_api_requests(urls, timeout, retries, backoff, validation, cache=default_params["cache"])
+                if any(page is None for page in pages):
                     return None
-                all_data.extend(data.get("data", []))
-                if len(all_data) >= data.get("total", 0):
-                    break
-                params["start"] = str(len(all_data)) #update starting position
-
-            if filter_fields:
-                filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-                all_data = [{key: player[key] for key in filter_fields if key in player} for player in all_data]
+                for page in pages:
+                    all_data.extend(page.get("data", []))
+                url = urls[-1]
 
+            all_data = _postprocess_list(all_data, filter_fields=filter_fields)
             all_data = {"data": all_data, "total": len(all_data)}
             filtered_data = filter_view(all_data, view, validation) if view is not None else all_data
-            sort = [sort] if isinstance(sort, str) else sort
-            direction = [direction] if isinstance(direction, str) else direction
 
-            return {"path": url, "view": view, "fields": filter_fields, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+            return _build_return(filtered_data, return_info, url, view, filter_fields, sort, direction)
 
         else:
-            params["start"] = str(default_params.get("start", True))
-            url = f"{base_url}{key}/{report}?{'&'.join([f'{key}={value}' for key, value in params.items()])}"
-            data = make_api_request(url, timeout, retries, backoff, validation)
+            url = f"{url_prefix}{default_params.get('start', 0)}"
+            data = make_api_request(url, timeout, retries, backoff, validation, cache=default_params["cache"])
 
-            if filter_fields:
-                filter_fields = [filter_fields] if isinstance(filter_fields, str) else filter_fields
-                data["data"] = [{key: player[key] for key in filter_fields if key in player} for player in data["data"]]
+            if data is None:
+                return None
 
+            data["data"] = _postprocess_list(data["data"], filter_fields=filter_fields)
             filtered_data = filter_view(data, view, validation) if view is not None else data
-            sort = [sort] if isinstance(sort, str) else sort
-            direction = [direction] if isinstance(direction, str) else direction
 
-            return {"path": url, "view": view, "fields": filter_fields, "sort": {s: d for s, d in zip(sort, direction)} if sort is not None else None, "response": filtered_data} if return_info else filtered_data
+            return _build_return(filtered_data, return_info, url, view, filter_fields, sort, direction)